@@ -88,7 +88,7 @@ class JSONRPCRequest(BaseModel):
 
     jsonrpc: str = "2.0"
     method: str
-    params: Union[A2AMessage, Dict[str, Any]]
+    params: Union[Dict[str, Any], A2AMessage] = Field(union_mode="left_to_right")
     id: Union[str, int]
 
 
@@ -121,7 +121,7 @@ class JSONRPCNotification(BaseModel):
 
     jsonrpc: str = "2.0"
     method: str
-    params: Union[A2AMessage, Dict[str, Any]]
+    params: Union[Dict[str, Any], A2AMessage] = Field(union_mode="left_to_right")
 
 
 # Message type registry for extensibility
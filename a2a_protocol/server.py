@@ -6,15 +6,22 @@ supporting the enhanced message types and providing extensible method handling.
 """
 
 import asyncio
-import json
 import logging
 import os
-from typing import Any, Callable, Dict, Optional
-from aiohttp import web
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
+import orjson
+from aiohttp import hdrs, web
 from aiohttp.web import Request, Response
 
-from .validation import MessageValidator
-from .schemas import JSONRPCRequest, JSONRPCNotification, JSONRPCErrorResponse
+from .validation import JSONRPCMessage, MessageValidator
+from .schemas import (
+    A2AMessage,
+    JSONRPCRequest,
+    JSONRPCResponse,
+    JSONRPCNotification,
+    JSONRPCErrorResponse,
+    get_message_class,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -22,42 +29,104 @@ logger = logging.getLogger(__name__)
 class A2AServer:
     """Asynchronous JSON-RPC server for A2A protocol"""
 
-    def __init__(self, host: str = None, port: int = None):
+    def __init__(
+        self,
+        host: str = None,
+        port: int = None,
+        client_max_size: int = 1024**2,
+        notification_workers: int = 4,
+        notification_queue_size: int = 10_000,
+        notification_drain_timeout: float = 10.0,
+    ):
         self.host = host or os.getenv("A2A_HOST", "0.0.0.0")
         self.port = port or int(os.getenv("A2A_PORT", "8080"))
         self.host = host
         self.port = port
-        self.app = web.Application()
+        self.client_max_size = client_max_size
+        self.app = web.Application(client_max_size=client_max_size)
         self.methods: Dict[str, Callable] = {}
+        # Handler and message class per method, resolved at registration
+        self._dispatch: Dict[str, Tuple[Callable, Optional[Type[A2AMessage]]]] = {}
+        # Notifications are queued and drained by a fixed pool of workers
+        self.notification_workers = notification_workers
+        self.notification_drain_timeout = notification_drain_timeout
+        self._notification_queue: asyncio.Queue = asyncio.Queue(
+            maxsize=notification_queue_size
+        )
+        self._workers: List[asyncio.Task] = []
+        self._update_health_body()
         self._setup_routes()
 
     def _setup_routes(self):
         """Setup HTTP routes"""
         self.app.router.add_post("/jsonrpc", self._handle_jsonrpc)
         self.app.router.add_get("/health", self._handle_health)
+        self.app.on_startup.append(self._start_notification_workers)
+        self.app.on_cleanup.append(self._stop_notification_workers)
+
+    async def _start_notification_workers(self, app: web.Application):
+        """Start the notification worker pool"""
+        self._workers = [
+            asyncio.create_task(self._notification_worker())
+            for _ in range(self.notification_workers)
+        ]
+
+    async def _stop_notification_workers(self, app: web.Application):
+        """Drain queued notifications, then cancel the notification worker pool"""
+        try:
+            await asyncio.wait_for(
+                self._notification_queue.join(), self.notification_drain_timeout
+            )
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Dropping {self._notification_queue.qsize()} queued notifications "
+                f"after {self.notification_drain_timeout}s shutdown timeout"
+            )
+
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def _notification_worker(self):
+        """Process queued notifications until cancelled"""
+        while True:
+            notification = await self._notification_queue.get()
+            try:
+                await self._handle_notification(notification)
+            except Exception as e:
+                logger.error(f"Error handling notification: {e}")
+            finally:
+                self._notification_queue.task_done()
 
     async def _handle_jsonrpc(self, request: Request) -> Response:
         """Handle JSON-RPC requests"""
         try:
-            raw_data = await request.text()
-            logger.debug(f"Received raw message: {raw_data}")
-
-            # Validate and parse the message
-            parsed_message = MessageValidator.validate_jsonrpc_message(raw_data)
-
-            if isinstance(parsed_message, JSONRPCErrorResponse):
-                return self._json_response(parsed_message.dict())
+            raw_data = await self._read_body(request)
+            if logger.isEnabledFor(logging.DEBUG):
+                raw_text = raw_data.decode("utf-8", "replace")
+                logger.debug(f"Received raw message: {raw_text}")
+
+            # Validate and parse the message or batch
+            parsed = MessageValidator.validate_jsonrpc_payload(raw_data)
+
+            if isinstance(parsed, list):
+                # Batch: process concurrently, encode all responses at once
+                responses = await asyncio.gather(
+                    *(self._process_message(message) for message in parsed)
+                )
+                results = [r.dict() for r in responses if r is not None]
+                if not results:
+                    return Response(status=204)  # Only notifications
+                return self._json_response(results)
 
-            # Handle notification (no response expected)
-            if isinstance(parsed_message, JSONRPCNotification):
-                asyncio.create_task(self._handle_notification(parsed_message))
+            response = await self._process_message(parsed)
+            if response is None:
                 return Response(status=204)  # No Content
+            return self._json_response(response.dict())
 
-            # Handle request
-            if isinstance(parsed_message, JSONRPCRequest):
-                response = await self._handle_request(parsed_message)
-                return self._json_response(response.dict())
-
+        except web.HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Error handling request: {e}")
             error_response = MessageValidator._create_error_response(
@@ -65,20 +134,59 @@ class A2AServer:
             )
             return self._json_response(error_response.dict())
 
+    async def _process_message(
+        self, message: JSONRPCMessage
+    ) -> Optional[Union[JSONRPCResponse, JSONRPCErrorResponse]]:
+        """Handle one parsed JSON-RPC message; notifications return None"""
+        if isinstance(message, JSONRPCErrorResponse):
+            return message
+
+        # Handle notification (no response expected)
+        if isinstance(message, JSONRPCNotification):
+            # Waits for queue space when full, applying backpressure
+            await self._notification_queue.put(message)
+            return None
+
+        # Handle request
+        return await self._handle_request(message)
+
+    async def _read_body(self, request: Request) -> Union[bytes, bytearray]:
+        """Read the request body into a buffer pre-sized from Content-Length"""
+        content_length = request.content_length
+        if content_length is None or hdrs.CONTENT_ENCODING in request.headers:
+            # Unknown or encoded length; let aiohttp grow the buffer
+            return await request.read()
+
+        if content_length > self.client_max_size:
+            raise web.HTTPRequestEntityTooLarge(
+                max_size=self.client_max_size, actual_size=content_length
+            )
+
+        body = bytearray(content_length)
+        pos = 0
+        with memoryview(body) as view:
+            async for chunk in request.content.iter_any():
+                view[pos : pos + len(chunk)] = chunk
+                pos += len(chunk)
+
+        return body if pos == content_length else body[:pos]
+
     async def _handle_request(self, rpc_request: JSONRPCRequest) -> Any:
         """Handle JSON-RPC request and return response"""
         method = rpc_request.method
         params = rpc_request.params
         msg_id = rpc_request.id
 
-        if method not in self.methods:
+        dispatch = self._dispatch.get(method)
+        if dispatch is None:
             return MessageValidator._create_error_response(
                 -32601, "Method not found", f"Method '{method}' not found", msg_id
             )
+        handler, message_class = dispatch
 
         try:
             # Validate A2A message if it's a known type
-            a2a_message = MessageValidator.validate_a2a_message(method, params)
+            a2a_message = self._validate_params(message_class, method, params)
             if a2a_message is None:
                 return MessageValidator._create_error_response(
                     -32602, "Invalid params", "Invalid A2A message parameters", msg_id
@@ -91,7 +199,6 @@ class A2AServer:
                 )
 
             # Call the method handler
-            handler = self.methods[method]
             result = await handler(a2a_message)
 
             return MessageValidator.create_success_response(result, msg_id)
@@ -107,30 +214,51 @@ class A2AServer:
         method = notification.method
         params = notification.params
 
-        if method not in self.methods:
+        dispatch = self._dispatch.get(method)
+        if dispatch is None:
             logger.warning(f"Notification for unknown method: {method}")
             return
+        handler, message_class = dispatch
 
         try:
-            a2a_message = MessageValidator.validate_a2a_message(method, params)
+            a2a_message = self._validate_params(message_class, method, params)
             if a2a_message and MessageValidator.validate_business_rules(a2a_message):
-                handler = self.methods[method]
                 await handler(a2a_message)
             else:
                 logger.warning(f"Invalid notification parameters for {method}")
         except Exception as e:
             logger.error(f"Error handling notification {method}: {e}")
 
+    @staticmethod
+    def _validate_params(
+        message_class: Optional[Type[A2AMessage]], method: str, params: Any
+    ) -> Optional[A2AMessage]:
+        """Validate params against the message class cached for a method"""
+        if message_class is None:
+            logger.warning(f"Unknown message type: {method}")
+            return None
+        return MessageValidator.validate_message_params(message_class, method, params)
+
     async def _handle_health(self, request: Request) -> Response:
         """Health check endpoint"""
-        return self._json_response(
-            {"status": "healthy", "methods": list(self.methods.keys())}
+        return self._raw_json_response(self._health_body)
+
+    def _update_health_body(self):
+        """Pre-serialize the health check payload for the registered methods"""
+        self._health_body = orjson.dumps(
+            {"status": "healthy", "methods": list(self.methods)}
         )
 
-    def _json_response(self, data: Dict[str, Any]) -> Response:
+    def _json_response(self, data: Union[Dict[str, Any], List[Any]]) -> Response:
         """Create JSON response"""
+        return self._raw_json_response(
+            orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        )
+
+    def _raw_json_response(self, body: bytes) -> Response:
+        """Create JSON response from an already serialized body"""
         return Response(
-            text=json.dumps(data),
+            body=body,
             content_type="application/json",
             headers={"Access-Control-Allow-Origin": "*"},
         )
@@ -144,6 +272,8 @@ class A2AServer:
             handler: Async callable that takes an A2AMessage and returns a result
         """
         self.methods[method_name] = handler
+        self._dispatch[method_name] = (handler, get_message_class(method_name))
+        self._update_health_body()
         logger.info(f"Registered method: {method_name}")
 
     async def start(self):
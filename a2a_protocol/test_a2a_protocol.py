@@ -133,6 +133,28 @@ class TestMessageValidator:
         assert hasattr(result, "error")
         assert result.error.code == -32600
 
+    def test_validate_jsonrpc_message_rejects_batch(self):
+        """Test that a single-message validation rejects a batch"""
+        message = [{"jsonrpc": "2.0", "method": "test", "id": "test_1"}]
+
+        result = MessageValidator.validate_jsonrpc_message(json.dumps(message))
+
+        assert hasattr(result, "error")
+        assert result.error.code == -32600
+
+    def test_validate_jsonrpc_payload_batch(self):
+        """Test validating a batch payload item by item"""
+        message = [
+            {"jsonrpc": "2.0", "method": "test", "id": "test_1"},
+            {"jsonrpc": "1.0", "method": "test", "id": "test_2"},
+        ]
+
+        result = MessageValidator.validate_jsonrpc_payload(json.dumps(message))
+
+        assert isinstance(result, list)
+        assert isinstance(result[0], JSONRPCRequest)
+        assert result[1].error.code == -32600
+
     def test_validate_a2a_message_valid(self):
         """Test validating a valid A2A message"""
         params = {
@@ -300,6 +322,188 @@ class TestA2AServer:
 
         assert "TEST_METHOD" in server.methods
 
+    def test_register_method_resolves_message_class(self, server):
+        """Test that registration caches the handler and message class"""
+
+        async def test_handler(message):
+            return {"result": "test"}
+
+        server.register_method("GEOSPATIAL_ANOMALY_IDENTIFIED", test_handler)
+        server.register_method("TEST_METHOD", test_handler)
+
+        assert server._dispatch["GEOSPATIAL_ANOMALY_IDENTIFIED"] == (
+            test_handler,
+            GeospatialAnomalyIdentified,
+        )
+        assert server._dispatch["TEST_METHOD"] == (test_handler, None)
+
+    @pytest.mark.asyncio
+    async def test_handle_request_unknown_method(self, server):
+        """Test that unregistered methods return a method-not-found error"""
+        request = JSONRPCRequest(method="UNKNOWN_METHOD", params={}, id="req_1")
+
+        response = await server._handle_request(request)
+
+        assert response.error.code == -32601
+
+    @pytest.mark.asyncio
+    async def test_handle_request_validates_params(self, server):
+        """Test that params are validated into the registered message class"""
+        handler = AsyncMock(return_value={"status": "processed"})
+        server.register_method("GEOSPATIAL_ANOMALY_IDENTIFIED", handler)
+        request = JSONRPCRequest(
+            method="GEOSPATIAL_ANOMALY_IDENTIFIED",
+            params={
+                "sender_agent": "test_agent",
+                "anomaly_type": "test",
+                "location": {"lat": 0, "lon": 0},
+                "confidence": 0.8,
+                "description": "test",
+                "data_source": "test",
+            },
+            id="req_1",
+        )
+
+        response = await server._handle_request(request)
+
+        assert response.result == {"status": "processed"}
+        message = handler.await_args.args[0]
+        assert isinstance(message, GeospatialAnomalyIdentified)
+        assert message.anomaly_type == "test"
+
+    @pytest.mark.asyncio
+    async def test_handle_request_invalid_params(self, server):
+        """Test that invalid params return an invalid-params error"""
+        handler = AsyncMock()
+        server.register_method("GEOSPATIAL_ANOMALY_IDENTIFIED", handler)
+        request = JSONRPCRequest(
+            method="GEOSPATIAL_ANOMALY_IDENTIFIED",
+            params={"sender_agent": "test_agent"},
+            id="req_1",
+        )
+
+        response = await server._handle_request(request)
+
+        assert response.error.code == -32602
+        handler.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_handle_jsonrpc_reads_body(self, server):
+        """Test reading a JSON-RPC request body over HTTP"""
+        from aiohttp.test_utils import TestClient, TestServer
+
+        message = {"jsonrpc": "2.0", "method": "UNKNOWN_METHOD", "id": "req_1"}
+
+        async with TestClient(TestServer(server.app)) as client:
+            response = await client.post("/jsonrpc", data=json.dumps(message))
+            body = await response.json()
+
+        assert body["id"] == "req_1"
+        assert body["error"]["code"] == -32601
+
+    @pytest.mark.asyncio
+    async def test_handle_jsonrpc_rejects_oversized_body(self):
+        """Test that bodies above client_max_size are rejected"""
+        from aiohttp.test_utils import TestClient, TestServer
+
+        server = A2AServer("localhost", 8080, client_max_size=16)
+        message = {"jsonrpc": "2.0", "method": "UNKNOWN_METHOD", "id": "req_1"}
+
+        async with TestClient(TestServer(server.app)) as client:
+            response = await client.post("/jsonrpc", data=json.dumps(message))
+
+        assert response.status == 413
+
+    @pytest.mark.asyncio
+    async def test_handle_jsonrpc_queues_notifications(self, server):
+        """Test that notifications are processed by the worker pool"""
+        from aiohttp.test_utils import TestClient, TestServer
+
+        message = {"jsonrpc": "2.0", "method": "TEST_METHOD", "params": {}}
+
+        with patch.object(
+            server, "_handle_notification", new_callable=AsyncMock
+        ) as mock_handle:
+            async with TestClient(TestServer(server.app)) as client:
+                assert len(server._workers) == server.notification_workers
+
+                response = await client.post("/jsonrpc", data=json.dumps(message))
+                await server._notification_queue.join()
+
+            assert response.status == 204
+            mock_handle.assert_awaited_once()
+            assert server._workers == []
+
+    @pytest.mark.asyncio
+    async def test_shutdown_drains_notifications(self, server):
+        """Test that queued notifications are handled before shutdown"""
+        from aiohttp.test_utils import TestClient, TestServer
+
+        message = {"jsonrpc": "2.0", "method": "TEST_METHOD", "params": {}}
+        handled = []
+
+        async def slow_handle(notification):
+            await asyncio.sleep(0.05)
+            handled.append(notification)
+
+        with patch.object(server, "_handle_notification", side_effect=slow_handle):
+            async with TestClient(TestServer(server.app)) as client:
+                for _ in range(3):
+                    await client.post("/jsonrpc", data=json.dumps(message))
+
+        assert len(handled) == 3
+        assert server._notification_queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_shutdown_drain_timeout(self):
+        """Test that shutdown gives up draining after the timeout"""
+        from aiohttp.test_utils import TestClient, TestServer
+
+        server = A2AServer("localhost", 8080, notification_drain_timeout=0.01)
+        message = {"jsonrpc": "2.0", "method": "TEST_METHOD", "params": {}}
+
+        async def stuck_handle(notification):
+            await asyncio.Event().wait()
+
+        with patch.object(server, "_handle_notification", side_effect=stuck_handle):
+            async with TestClient(TestServer(server.app)) as client:
+                await client.post("/jsonrpc", data=json.dumps(message))
+
+        assert server._workers == []
+
+    @pytest.mark.asyncio
+    async def test_handle_jsonrpc_batch(self, server):
+        """Test that a batch returns one response per request"""
+        from aiohttp.test_utils import TestClient, TestServer
+
+        batch = [
+            {"jsonrpc": "2.0", "method": "UNKNOWN_METHOD", "id": "req_1"},
+            {"jsonrpc": "1.0", "method": "UNKNOWN_METHOD", "id": "req_2"},
+            {"jsonrpc": "2.0", "method": "UNKNOWN_METHOD", "params": {}},
+        ]
+
+        with patch.object(server, "_handle_notification", new_callable=AsyncMock):
+            async with TestClient(TestServer(server.app)) as client:
+                response = await client.post("/jsonrpc", data=json.dumps(batch))
+                data = await response.json()
+
+        assert isinstance(data, list)
+        assert len(data) == 2
+        assert data[0]["id"] == "req_1"
+        assert data[0]["error"]["code"] == -32601
+        assert data[1]["error"]["code"] == -32600
+
+    @pytest.mark.asyncio
+    async def test_handle_jsonrpc_empty_batch(self, server):
+        """Test that an empty batch is an invalid request"""
+        from aiohttp.test_utils import TestClient, TestServer
+
+        async with TestClient(TestServer(server.app)) as client:
+            response = await client.post("/jsonrpc", data="[]")
+            data = await response.json()
+
+        assert data["error"]["code"] == -32600
+
     @pytest.mark.asyncio
     async def test_handle_health(self, server):
         """Test health check endpoint"""
@@ -311,6 +515,35 @@ class TestA2AServer:
         assert response.status == 200
         # Note: In real scenario, would check response body
 
+    @pytest.mark.asyncio
+    async def test_handle_health_lists_registered_methods(self, server):
+        """Test that the health payload tracks method registration"""
+        from aiohttp.test_utils import make_mocked_request
+
+        async def test_handler(message):
+            return {"result": "test"}
+
+        server.register_method("TEST_METHOD", test_handler)
+
+        request = make_mocked_request("GET", "/health")
+        response = await server._handle_health(request)
+
+        assert json.loads(response.body) == {
+            "status": "healthy",
+            "methods": ["TEST_METHOD"],
+        }
+
+    def test_json_response(self, server):
+        """Test JSON response serialization"""
+        timestamp = datetime(2024, 1, 1, 12, 0, 0)
+        response = server._json_response({"id": 1, "timestamp": timestamp})
+
+        assert response.content_type == "application/json"
+        assert json.loads(response.body) == {
+            "id": 1,
+            "timestamp": "2024-01-01T12:00:00",
+        }
+
 
 class TestMessageTypeRegistry:
     """Test message type registry"""
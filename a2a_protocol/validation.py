@@ -5,10 +5,12 @@ This module provides validation for incoming JSON-RPC messages and A2A protocol
 messages, ensuring they conform to the expected schemas and business rules.
 """
 
-import json
 import logging
-from typing import Any, Dict, Optional, Union
-from pydantic import ValidationError
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+import orjson
+from pydantic import ValidationError as PydanticValidationError
 
 from .schemas import (
     A2AMessage,
@@ -24,33 +26,80 @@ from .schemas import (
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _business_rule_fields(message_class: Type[A2AMessage]) -> Tuple[bool, bool]:
+    """Return whether a message class has confidence and rating fields"""
+    fields = message_class.model_fields
+    return "confidence" in fields, "rating" in fields
+
+
+JSONRPCMessage = Union[JSONRPCRequest, JSONRPCNotification, JSONRPCErrorResponse]
+
+
 class MessageValidator:
     """Validator for A2A protocol messages"""
 
     @staticmethod
-    def validate_jsonrpc_message(
-        raw_message: str,
-    ) -> Union[JSONRPCRequest, JSONRPCNotification, JSONRPCErrorResponse]:
+    def validate_jsonrpc_payload(
+        raw_payload: Union[str, bytes, bytearray],
+    ) -> Union[JSONRPCMessage, List[JSONRPCMessage]]:
         """
-        Validate and parse a raw JSON-RPC message.
+        Validate and parse a raw JSON-RPC payload, which may be a batch.
 
         Args:
-            raw_message: Raw JSON string
+            raw_payload: Raw JSON string or bytes
 
         Returns:
-            Parsed JSON-RPC message object
-
-        Raises:
-            ValueError: If message is invalid
+            Parsed JSON-RPC message object, or a list of them for a batch
         """
         try:
-            data = json.loads(raw_message)
-        except json.JSONDecodeError as e:
+            data = orjson.loads(raw_payload)
+        except orjson.JSONDecodeError as e:
             logger.error(f"Invalid JSON: {e}")
             return MessageValidator._create_error_response(
                 -32700, "Parse error", str(e), None
             )
 
+        if isinstance(data, list):
+            if not data:
+                return MessageValidator._create_error_response(
+                    -32600, "Invalid Request", "Empty batch", None
+                )
+            return [MessageValidator.validate_jsonrpc_data(item) for item in data]
+
+        return MessageValidator.validate_jsonrpc_data(data)
+
+    @staticmethod
+    def validate_jsonrpc_message(
+        raw_message: Union[str, bytes, bytearray],
+    ) -> JSONRPCMessage:
+        """
+        Validate and parse a raw JSON-RPC message, rejecting batches.
+
+        Args:
+            raw_message: Raw JSON string or bytes
+
+        Returns:
+            Parsed JSON-RPC message object
+        """
+        parsed = MessageValidator.validate_jsonrpc_payload(raw_message)
+        if isinstance(parsed, list):
+            return MessageValidator._create_error_response(
+                -32600, "Invalid Request", "Batch requests are not accepted", None
+            )
+        return parsed
+
+    @staticmethod
+    def validate_jsonrpc_data(data: Any) -> JSONRPCMessage:
+        """
+        Validate an already decoded JSON-RPC message.
+
+        Args:
+            data: Decoded JSON value
+
+        Returns:
+            Parsed JSON-RPC message object
+        """
         # Check for required jsonrpc field
         if not isinstance(data, dict) or data.get("jsonrpc") != "2.0":
             return MessageValidator._create_error_response(
@@ -71,7 +120,7 @@ class MessageValidator:
         if msg_id is None:
             try:
                 return JSONRPCNotification(method=method, params=params)
-            except ValidationError as e:
+            except PydanticValidationError as e:
                 return MessageValidator._create_error_response(
                     -32602, "Invalid params", str(e), None
                 )
@@ -79,7 +128,7 @@ class MessageValidator:
         # It's a request
         try:
             return JSONRPCRequest(method=method, params=params, id=msg_id)
-        except ValidationError as e:
+        except PydanticValidationError as e:
             return MessageValidator._create_error_response(
                 -32602, "Invalid params", str(e), msg_id
             )
@@ -103,11 +152,28 @@ class MessageValidator:
             logger.warning(f"Unknown message type: {method}")
             return None
 
+        return MessageValidator.validate_message_params(message_class, method, params)
+
+    @staticmethod
+    def validate_message_params(
+        message_class: Type[A2AMessage], method: str, params: Dict[str, Any]
+    ) -> Optional[A2AMessage]:
+        """
+        Validate parameters against an already resolved A2A message class.
+
+        Args:
+            message_class: The A2A message class for the method
+            method: JSON-RPC method name
+            params: Method parameters
+
+        Returns:
+            Validated A2A message object or None if invalid
+        """
         try:
-            message = message_class(**params)
+            message = message_class.model_validate(params)
             logger.info(f"Validated message: {method} from {message.sender_agent}")
             return message
-        except ValidationError as e:
+        except PydanticValidationError as e:
             logger.error(f"Message validation failed for {method}: {e}")
             return None
 
@@ -122,19 +188,19 @@ class MessageValidator:
         Returns:
             True if valid, False otherwise
         """
+        has_confidence, has_rating = _business_rule_fields(type(message))
+
         # Example business rules
-        if hasattr(message, "confidence") and message.confidence < 0.1:
+        if has_confidence and message.confidence < 0.1:
             logger.warning(f"Low confidence message: {message.confidence}")
             return False
 
-        if hasattr(message, "rating") and message.rating is not None:
+        if has_rating and message.rating is not None:
             if not (1 <= message.rating <= 5):
                 logger.error(f"Invalid rating: {message.rating}")
                 return False
 
         # Check timestamp is not in future
-        from datetime import datetime
-
         if message.timestamp > datetime.utcnow():
             logger.warning("Message timestamp is in the future")
             return False
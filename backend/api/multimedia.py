@@ -8,6 +8,7 @@ from .. import crud, schemas
 router = APIRouter()
 
 UPLOAD_DIR = "uploads"
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
 
@@ -21,8 +22,9 @@ async def upload_file(
     file_path = f"{UPLOAD_DIR}/{file.filename}"
 
     async with aiofiles.open(file_path, "wb") as out_file:
-        content = await file.read()
-        await out_file.write(content)
+        # Stream in chunks so memory use does not grow with upload size
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            await out_file.write(chunk)
 
     # Determine file type
     file_type = file.content_type.split("/")[0] if file.content_type else "unknown"
@@ -6,33 +6,223 @@ This module handles CSV data ingestion, including reading, cleaning, validation,
 and insertion into the PostgreSQL/PostGIS database.
 """
 
+import asyncio
 import csv
+import io
 import logging
+import numpy as np
 import pandas as pd
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from pathlib import Path
-import re
 from datetime import datetime
 
+from psycopg2.extras import execute_values
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; NumPy is used without it
+    njit = None
+
 from .connection import PostGISConnection
 from .schema import initialize_database
 
 logger = logging.getLogger(__name__)
 
+# Loads larger than this are staged with COPY instead of batched INSERTs
+COPY_THRESHOLD = 100_000
+
+# Rows read per chunk when streaming CSV files
+CSV_CHUNK_SIZE = 250_000
+
+# Accepted source_url schemes
+URL_PREFIXES = ("http://", "https://")
+
+# SRID of the puzzle_pieces.geom column
+GEOM_SRID = 4326
+
+# Little-endian EWKB point with an embedded SRID: byte order, geometry type
+# (Point | SRID flag), SRID, x, y
+EWKB_POINT_DTYPE = np.dtype(
+    [("order", "u1"), ("type", "<u4"), ("srid", "<u4"), ("x", "<f8"), ("y", "<f8")]
+)
+EWKB_POINT_SRID_TYPE = 0x20000001
+
+# Rows whose values are unchanged are skipped, so geom and the indexes are
+# not rewritten for them
+UPSERT_CONFLICT_CLAUSE = """
+ON CONFLICT (row_number) DO UPDATE SET
+    name = EXCLUDED.name,
+    entity = EXCLUDED.entity,
+    sub_entity = EXCLUDED.sub_entity,
+    description = EXCLUDED.description,
+    source_url = EXCLUDED.source_url,
+    latitude = EXCLUDED.latitude,
+    longitude = EXCLUDED.longitude,
+    geom = EXCLUDED.geom,
+    updated_at = CURRENT_TIMESTAMP
+WHERE (
+    puzzle_pieces.name, puzzle_pieces.entity, puzzle_pieces.sub_entity,
+    puzzle_pieces.description, puzzle_pieces.source_url,
+    puzzle_pieces.latitude, puzzle_pieces.longitude
+) IS DISTINCT FROM (
+    EXCLUDED.name, EXCLUDED.entity, EXCLUDED.sub_entity,
+    EXCLUDED.description, EXCLUDED.source_url,
+    EXCLUDED.latitude, EXCLUDED.longitude
+)
+"""
+
+INSERT_QUERY = (
+    """
+INSERT INTO puzzle_pieces (
+    row_number, name, entity, sub_entity, description,
+    source_url, latitude, longitude, geom
+) VALUES %s
+"""
+    + UPSERT_CONFLICT_CLAUSE
+)
+
+INSERT_TEMPLATE = "(%s, %s, %s, %s, %s, %s, %s, %s, %s::geometry)"
+
+STAGING_TABLE_SCHEMA = """
+CREATE TEMP TABLE IF NOT EXISTS puzzle_pieces_staging (
+    row_number INTEGER,
+    name VARCHAR(255),
+    entity VARCHAR(255),
+    sub_entity VARCHAR(255),
+    description TEXT,
+    source_url TEXT,
+    latitude DOUBLE PRECISION,
+    longitude DOUBLE PRECISION,
+    geom GEOMETRY(POINT, 4326)
+) ON COMMIT DROP
+"""
+
+STAGING_COPY_QUERY = """
+COPY puzzle_pieces_staging (
+    row_number, name, entity, sub_entity, description,
+    source_url, latitude, longitude, geom
+) FROM STDIN WITH (FORMAT csv)
+"""
+
+STAGING_TRUNCATE_QUERY = "TRUNCATE puzzle_pieces_staging"
+
+STAGING_MERGE_QUERY = (
+    """
+INSERT INTO puzzle_pieces (
+    row_number, name, entity, sub_entity, description,
+    source_url, latitude, longitude, geom
+)
+SELECT
+    row_number, name, entity, sub_entity, description,
+    source_url, latitude, longitude, geom
+FROM puzzle_pieces_staging
+"""
+    + UPSERT_CONFLICT_CLAUSE
+)
+
+
+if njit is not None:
+    # Serial on purpose: the loop is memory-bound, and parallel kernels abort
+    # the process when called from several threads under the workqueue layer
+    @njit(cache=True)
+    def _coordinate_stats_jit(latitudes, longitudes):
+        invalid_lat = 0
+        invalid_lon = 0
+        zero_pairs = 0
+        for i in range(latitudes.shape[0]):
+            lat = latitudes[i]
+            lon = longitudes[i]
+            if lat < -90.0 or lat > 90.0:
+                invalid_lat += 1
+            if lon < -180.0 or lon > 180.0:
+                invalid_lon += 1
+            if lat == 0.0 and lon == 0.0:
+                zero_pairs += 1
+        return invalid_lat, invalid_lon, zero_pairs
+
+else:
+    _coordinate_stats_jit = None
+
+
+def points_to_ewkb_hex(
+    longitudes: np.ndarray, latitudes: np.ndarray, srid: int = GEOM_SRID
+) -> List[str]:
+    """
+    Encode coordinates as hex EWKB points that PostGIS parses directly.
+
+    Args:
+        longitudes: Longitude (x) values
+        latitudes: Latitude (y) values of the same length
+        srid: Spatial reference id embedded in each point
+
+    Returns:
+        List of hex-encoded EWKB strings, one per point
+    """
+    points = np.empty(len(longitudes), dtype=EWKB_POINT_DTYPE)
+    points["order"] = 1
+    points["type"] = EWKB_POINT_SRID_TYPE
+    points["srid"] = srid
+    points["x"] = longitudes
+    points["y"] = latitudes
+
+    encoded = points.tobytes().hex().upper()
+    width = 2 * EWKB_POINT_DTYPE.itemsize
+    return [encoded[i : i + width] for i in range(0, len(encoded), width)]
+
+
+def coordinate_stats(
+    latitudes: np.ndarray, longitudes: np.ndarray
+) -> Tuple[int, int, int]:
+    """
+    Count coordinate problems in a single pass over float64 arrays.
+
+    NaN values are never counted. numba is not in requirements.txt, so the
+    vectorized NumPy path is the default; a Numba-compiled loop is used
+    only when numba happens to be installed.
+
+    Args:
+        latitudes: Latitude values
+        longitudes: Longitude values of the same length
+
+    Returns:
+        Tuple of (invalid_latitudes, invalid_longitudes, zero_coordinate_pairs)
+    """
+    if _coordinate_stats_jit is not None:
+        invalid_lat, invalid_lon, zero_pairs = _coordinate_stats_jit(
+            latitudes, longitudes
+        )
+    else:
+        invalid_lat, invalid_lon, zero_pairs = _coordinate_stats_numpy(
+            latitudes, longitudes
+        )
+    return int(invalid_lat), int(invalid_lon), int(zero_pairs)
+
+
+def _coordinate_stats_numpy(
+    latitudes: np.ndarray, longitudes: np.ndarray
+) -> Tuple[int, int, int]:
+    """Vectorized NumPy counterpart of _coordinate_stats_jit."""
+    invalid_lat = np.count_nonzero((latitudes < -90) | (latitudes > 90))
+    invalid_lon = np.count_nonzero((longitudes < -180) | (longitudes > 180))
+    zero_pairs = np.count_nonzero((latitudes == 0) & (longitudes == 0))
+    return invalid_lat, invalid_lon, zero_pairs
+
 
 class PuzzlePiecesIngestion:
     """
     Handles ingestion of puzzle pieces data from CSV files.
     """
 
-    def __init__(self, db: PostGISConnection):
+    def __init__(self, db: PostGISConnection, copy_threshold: int = COPY_THRESHOLD):
         """
         Initialize the ingestion handler.
 
         Args:
             db: PostGISConnection instance
+            copy_threshold: Row count above which COPY is used for loading
         """
         self.db = db
+        self.copy_threshold = copy_threshold
         self.expected_columns = [
             "row_number",
             "name",
@@ -72,6 +262,30 @@ class PuzzlePiecesIngestion:
             logger.error(f"Failed to read CSV file {file_path}: {e}")
             raise
 
+    def read_csv_chunks(
+        self, file_path: str, chunk_size: int = CSV_CHUNK_SIZE
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Stream a CSV file as a sequence of DataFrames.
+
+        Args:
+            file_path: Path to the CSV file
+            chunk_size: Number of rows per chunk
+
+        Yields:
+            pandas.DataFrame: Consecutive chunks of the CSV file
+        """
+        logger.info(f"Streaming CSV file: {file_path} ({chunk_size} rows per chunk)")
+
+        with pd.read_csv(
+            file_path,
+            encoding="utf-8",
+            on_bad_lines="skip",  # Skip malformed lines
+            chunksize=chunk_size,
+        ) as reader:
+            for chunk in reader:
+                yield chunk
+
     def validate_csv_structure(self, df: pd.DataFrame) -> Tuple[bool, List[str]]:
         """
         Validate the CSV structure and required columns.
@@ -82,6 +296,19 @@ class PuzzlePiecesIngestion:
         Returns:
             Tuple of (is_valid, list_of_issues)
         """
+        issues = self.validate_csv_columns(df) + self.validate_csv_values(df)
+        return len(issues) == 0, issues
+
+    def validate_csv_columns(self, df: pd.DataFrame) -> List[str]:
+        """
+        Check that the required columns are present and the data is not empty.
+
+        Args:
+            df: DataFrame to validate
+
+        Returns:
+            List of issues found
+        """
         issues = []
 
         # Check for required columns
@@ -97,6 +324,20 @@ class PuzzlePiecesIngestion:
         if df.empty:
             issues.append("CSV file is empty")
 
+        return issues
+
+    def validate_csv_values(self, df: pd.DataFrame) -> List[str]:
+        """
+        Check column types and coordinate ranges.
+
+        Args:
+            df: DataFrame to validate
+
+        Returns:
+            List of issues found
+        """
+        issues = []
+
         # Check data types
         if "row_number" in df.columns:
             try:
@@ -104,25 +345,28 @@ class PuzzlePiecesIngestion:
             except:
                 issues.append("row_number column contains non-numeric values")
 
-        if "latitude" in df.columns:
-            try:
-                lat_numeric = pd.to_numeric(df["latitude"], errors="coerce")
-                invalid_lat = lat_numeric[(lat_numeric < -90) | (lat_numeric > 90)]
-                if not invalid_lat.empty:
-                    issues.append(f"Found {len(invalid_lat)} invalid latitude values")
-            except:
-                issues.append("latitude column contains invalid values")
-
-        if "longitude" in df.columns:
-            try:
-                lon_numeric = pd.to_numeric(df["longitude"], errors="coerce")
-                invalid_lon = lon_numeric[(lon_numeric < -180) | (lon_numeric > 180)]
-                if not invalid_lon.empty:
-                    issues.append(f"Found {len(invalid_lon)} invalid longitude values")
-            except:
-                issues.append("longitude column contains invalid values")
+        coordinates = {}
+        for coord in ["latitude", "longitude"]:
+            if coord in df.columns:
+                try:
+                    coordinates[coord] = pd.to_numeric(
+                        df[coord], errors="coerce"
+                    ).to_numpy(dtype="float64", na_value=np.nan)
+                except Exception:
+                    issues.append(f"{coord} column contains invalid values")
+
+        if coordinates:
+            missing = np.full(len(df), np.nan)
+            invalid_lat, invalid_lon, _ = coordinate_stats(
+                coordinates.get("latitude", missing),
+                coordinates.get("longitude", missing),
+            )
+            if invalid_lat:
+                issues.append(f"Found {invalid_lat} invalid latitude values")
+            if invalid_lon:
+                issues.append(f"Found {invalid_lon} invalid longitude values")
 
-        return len(issues) == 0, issues
+        return issues
 
     def clean_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -136,8 +380,9 @@ class PuzzlePiecesIngestion:
         """
         logger.info("Cleaning data...")
 
-        # Create a copy to avoid modifying original
-        cleaned_df = df.copy()
+        # Shallow copy: columns are reassigned below, so the original frame
+        # is left untouched without duplicating its data up front
+        cleaned_df = df.copy(deep=False)
 
         # Clean row_number
         if "row_number" in cleaned_df.columns:
@@ -154,31 +399,38 @@ class PuzzlePiecesIngestion:
         text_columns = ["name", "entity", "sub_entity", "description", "source_url"]
         for col in text_columns:
             if col in cleaned_df.columns:
-                # Remove leading/trailing whitespace
-                cleaned_df[col] = cleaned_df[col].astype(str).str.strip()
-
-                # Replace empty strings with None
-                cleaned_df[col] = cleaned_df[col].replace("", None)
+                # Remove leading/trailing whitespace and treat empty strings
+                # as missing; StringDtype keeps NA instead of "nan" text
+                cleaned_df[col] = (
+                    cleaned_df[col].astype("string").str.strip().replace("", pd.NA)
+                )
 
         # Remove rows with missing critical data
         critical_columns = ["row_number", "name"]
         cleaned_df = cleaned_df.dropna(subset=critical_columns)
 
-        # Remove duplicates based on row_number
-        if "row_number" in cleaned_df.columns:
-            cleaned_df = cleaned_df.drop_duplicates(subset=["row_number"])
+        # Remove duplicates based on row_number, keeping the latest row as the
+        # upsert does across chunks; skipped when the keys are already unique
+        if (
+            "row_number" in cleaned_df.columns
+            and not cleaned_df["row_number"].is_unique
+        ):
+            cleaned_df = cleaned_df.drop_duplicates(subset=["row_number"], keep="last")
 
         logger.info(f"Data cleaning completed. Rows: {len(cleaned_df)}")
         return cleaned_df
 
     def validate_data_quality(
-        self, df: pd.DataFrame
+        self, df: pd.DataFrame, seen_names: Optional[set] = None
     ) -> Tuple[bool, List[Dict[str, Any]]]:
         """
         Perform data quality validation.
 
         Args:
             df: Cleaned DataFrame
+            seen_names: Names from previously validated chunks of the same
+                file; repeats of them count as duplicates and the set is
+                updated with the names in df
 
         Returns:
             Tuple of (is_valid, list_of_quality_issues)
@@ -205,7 +457,10 @@ class PuzzlePiecesIngestion:
         # Check for coordinate consistency
         if "latitude" in df.columns and "longitude" in df.columns:
             # Check for (0,0) coordinates which might be placeholders
-            zero_coords = ((df["latitude"] == 0) & (df["longitude"] == 0)).sum()
+            _, _, zero_coords = coordinate_stats(
+                df["latitude"].to_numpy(dtype="float64", na_value=np.nan),
+                df["longitude"].to_numpy(dtype="float64", na_value=np.nan),
+            )
             if zero_coords > 0:
                 quality_issues.append(
                     {
@@ -217,7 +472,11 @@ class PuzzlePiecesIngestion:
 
         # Check for duplicate names
         if "name" in df.columns:
-            duplicate_names = df["name"].duplicated().sum()
+            duplicated = df["name"].duplicated()
+            if seen_names is not None:
+                duplicated |= df["name"].isin(seen_names)
+                seen_names.update(df["name"].dropna())
+            duplicate_names = int(duplicated.sum())
             if duplicate_names > 0:
                 quality_issues.append(
                     {
@@ -229,10 +488,8 @@ class PuzzlePiecesIngestion:
 
         # Check URL validity
         if "source_url" in df.columns:
-            invalid_urls = 0
-            for url in df["source_url"].dropna():
-                if not re.match(r"^https?://", str(url)):
-                    invalid_urls += 1
+            urls = df["source_url"].dropna().astype("string")
+            invalid_urls = int((~urls.str.startswith(URL_PREFIXES)).sum())
             if invalid_urls > 0:
                 quality_issues.append(
                     {
@@ -248,15 +505,69 @@ class PuzzlePiecesIngestion:
             quality_issues,
         )
 
+    @staticmethod
+    def _merge_quality_issues(
+        merged: Dict[Tuple[str, Optional[str]], Dict[str, Any]],
+        issues: List[Dict[str, Any]],
+    ) -> None:
+        """
+        Add per-chunk quality issues into running totals keyed by type and
+        column.
+
+        Args:
+            merged: Running totals, updated in place
+            issues: Quality issues reported for one chunk
+        """
+        for issue in issues:
+            key = (issue["type"], issue.get("column"))
+            if key in merged:
+                merged[key]["count"] += issue["count"]
+            else:
+                merged[key] = dict(issue)
+
+    def _rows_for_insert(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Project a DataFrame onto the expected columns, keep only rows that
+        have both a latitude and a longitude, and add their EWKB geometry.
+
+        Rows sharing a row_number are reduced to the last one, because a
+        single INSERT ... ON CONFLICT DO UPDATE cannot update a row twice.
+
+        Args:
+            df: DataFrame to prepare
+
+        Returns:
+            pandas.DataFrame: Rows ready for insertion, with a geom column
+        """
+        projected = df.reindex(columns=self.expected_columns)
+        has_coordinates = (
+            projected["latitude"].notna().to_numpy()
+            & projected["longitude"].notna().to_numpy()
+        )
+        rows = projected[has_coordinates]
+        if not rows["row_number"].is_unique:
+            rows = rows.drop_duplicates(subset=["row_number"], keep="last")
+        return rows.assign(
+            geom=points_to_ewkb_hex(
+                rows["longitude"].to_numpy(dtype="float64"),
+                rows["latitude"].to_numpy(dtype="float64"),
+            )
+        )
+
     def insert_data_batch(
-        self, df: pd.DataFrame, batch_size: int = 1000
+        self, df: pd.DataFrame, batch_size: int = 1000, commit: bool = True
     ) -> Tuple[int, List[str]]:
         """
         Insert data into the database in batches.
 
+        All batches run in one transaction, so a failing batch rolls back the
+        whole transaction and no records are kept.
+
         Args:
             df: DataFrame to insert
             batch_size: Number of records per batch
+            commit: Commit after the last batch; pass False to leave the
+                transaction open for the caller to commit
 
         Returns:
             Tuple of (records_inserted, list_of_errors)
@@ -266,75 +577,98 @@ class PuzzlePiecesIngestion:
         records_inserted = 0
         errors = []
 
-        # Prepare the insert query
-        insert_query = """
-        INSERT INTO puzzle_pieces (
-            row_number, name, entity, sub_entity, description,
-            source_url, latitude, longitude, geom
-        ) VALUES (
-            %s, %s, %s, %s, %s, %s, %s, %s,
-            ST_SetSRID(ST_MakePoint(%s, %s), 4326)
-        )
-        ON CONFLICT (row_number) DO UPDATE SET
-            name = EXCLUDED.name,
-            entity = EXCLUDED.entity,
-            sub_entity = EXCLUDED.sub_entity,
-            description = EXCLUDED.description,
-            source_url = EXCLUDED.source_url,
-            latitude = EXCLUDED.latitude,
-            longitude = EXCLUDED.longitude,
-            geom = EXCLUDED.geom,
-            updated_at = CURRENT_TIMESTAMP
-        """
+        # Prepare all columns once; rows without coordinates are skipped and
+        # missing values become None so psycopg2 can adapt them
+        insert_df = self._rows_for_insert(df)
+        insert_df = insert_df.astype(object).where(insert_df.notna(), None)
 
         # Process in batches
-        for i in range(0, len(df), batch_size):
-            batch_df = df.iloc[i : i + batch_size]
+        for i in range(0, len(insert_df), batch_size):
+            batch_df = insert_df.iloc[i : i + batch_size]
 
             try:
-                # Prepare batch data
-                batch_data = []
-                for _, row in batch_df.iterrows():
-                    # Handle potential NaN values
-                    lat = row.get("latitude")
-                    lon = row.get("longitude")
-
-                    # Skip rows with invalid coordinates
-                    if pd.isna(lat) or pd.isna(lon):
-                        continue
-
-                    batch_data.append(
-                        (
-                            row.get("row_number"),
-                            row.get("name"),
-                            row.get("entity"),
-                            row.get("sub_entity"),
-                            row.get("description"),
-                            row.get("source_url"),
-                            lat,
-                            lon,
-                            lon,  # For geom point (longitude first in PostGIS)
-                            lat,
-                        )
-                    )
-
-                if batch_data:
-                    # Execute batch insert
-                    self.db.cursor.executemany(insert_query, batch_data)
-                    self.db.connection.commit()
-                    records_inserted += len(batch_data)
-                    logger.info(
-                        f"Inserted batch {i//batch_size + 1}: {len(batch_data)} records"
-                    )
+                # Rows are streamed straight into execute_values, which
+                # mogrifies them into a single multi-row statement
+                execute_values(
+                    self.db.cursor,
+                    INSERT_QUERY,
+                    batch_df.itertuples(index=False, name=None),
+                    template=INSERT_TEMPLATE,
+                    page_size=batch_size,
+                )
+                records_inserted += len(batch_df)
+                logger.info(
+                    f"Inserted batch {i//batch_size + 1}: {len(batch_df)} records"
+                )
 
             except Exception as e:
                 error_msg = f"Failed to insert batch {i//batch_size + 1}: {e}"
                 logger.error(error_msg)
                 errors.append(error_msg)
                 self.db.connection.rollback()
+                return 0, errors
+
+        if not commit:
+            return records_inserted, errors
+
+        # Commit once for all batches instead of paying a WAL flush per batch
+        try:
+            self.db.connection.commit()
+        except Exception as e:
+            error_msg = f"Failed to commit inserted batches: {e}"
+            logger.error(error_msg)
+            errors.append(error_msg)
+            self.db.connection.rollback()
+            return 0, errors
 
         return records_inserted, errors
 
+    def copy_data_bulk(
+        self, df: pd.DataFrame, commit: bool = True
+    ) -> Tuple[int, List[str]]:
+        """
+        Load data through COPY into a staging table and merge it server-side.
+
+        Args:
+            df: DataFrame to insert
+            commit: Commit after the merge; pass False to leave the
+                transaction open for the caller to commit
+
+        Returns:
+            Tuple of (records_inserted, list_of_errors)
+        """
+        logger.info(f"Copying {len(df)} records through staging table")
+
+        errors = []
+
+        # Rows without coordinates are skipped, as in insert_data_batch
+        valid_df = self._rows_for_insert(df)
+        buffer = io.StringIO()
+        valid_df.to_csv(buffer, index=False, header=False)
+        buffer.seek(0)
+
+        try:
+            self.db.cursor.execute(STAGING_TABLE_SCHEMA)
+            self.db.cursor.copy_expert(STAGING_COPY_QUERY, buffer)
+            self.db.cursor.execute(STAGING_MERGE_QUERY)
+            # Count submitted rows as insert_data_batch does; rowcount would
+            # leave out rows the upsert skipped as unchanged
+            records_inserted = len(valid_df)
+            # The staging table only drops on commit; empty it for the next
+            # call in the same transaction
+            self.db.cursor.execute(STAGING_TRUNCATE_QUERY)
+            if commit:
+                self.db.connection.commit()
+            logger.info(f"Merged {records_inserted} records from staging table")
+            return records_inserted, errors
+
+        except Exception as e:
+            error_msg = f"Failed to copy data: {e}"
+            logger.error(error_msg)
+            errors.append(error_msg)
+            self.db.connection.rollback()
+            return 0, errors
+
     def log_processing_result(
         self,
         operation: str,
@@ -362,13 +696,26 @@ class PuzzlePiecesIngestion:
         except Exception as e:
             logger.error(f"Failed to log processing result: {e}")
 
-    def ingest_csv_file(self, file_path: str, batch_size: int = 1000) -> Dict[str, Any]:
+    def ingest_csv_file(
+        self,
+        file_path: str,
+        batch_size: int = 1000,
+        chunk_size: int = CSV_CHUNK_SIZE,
+    ) -> Dict[str, Any]:
         """
         Complete ingestion process for a CSV file.
 
+        The file is streamed in chunks; each chunk is validated, cleaned and
+        inserted before the next one is read, so at most chunk_size rows are
+        held in memory. The set of distinct names used to count duplicates
+        across chunks still grows with the file. All chunks are loaded
+        in one transaction that is committed after the last chunk; any error
+        rolls back the whole file.
+
         Args:
             file_path: Path to the CSV file
             batch_size: Batch size for insertion
+            chunk_size: Number of CSV rows read per chunk
 
         Returns:
             Dictionary with ingestion results
@@ -383,33 +730,76 @@ class PuzzlePiecesIngestion:
         }
 
         try:
-            # Read CSV
-            df = self.read_csv_file(file_path)
-
-            # Validate structure
-            is_valid, structure_issues = self.validate_csv_structure(df)
-            if not is_valid:
-                result["errors"].extend(structure_issues)
-                result["success"] = False
-                return result
-
-            # Clean data
-            cleaned_df = self.clean_data(df)
-
-            # Validate data quality
-            is_quality_ok, quality_issues = self.validate_data_quality(cleaned_df)
-            result["quality_issues"] = quality_issues
-
-            # Insert data
-            records_inserted, insert_errors = self.insert_data_batch(
-                cleaned_df, batch_size
+            quality_totals = {}
+            seen_names = set()
+
+            for chunk_number, chunk in enumerate(
+                self.read_csv_chunks(file_path, chunk_size), start=1
+            ):
+                if chunk_number == 1:
+                    # Header-level problems apply to the whole file
+                    structure_issues = self.validate_csv_columns(chunk)
+                    if structure_issues:
+                        result["errors"].extend(structure_issues)
+                        result["success"] = False
+                        return result
+
+                # Invalid values in any chunk reject the whole file
+                value_issues = self.validate_csv_values(chunk)
+                if value_issues:
+                    result["errors"].extend(
+                        f"Chunk {chunk_number}: {issue}" for issue in value_issues
+                    )
+                    break
+
+                # Clean data
+                cleaned_df = self.clean_data(chunk)
+
+                # Validate data quality
+                _, quality_issues = self.validate_data_quality(cleaned_df, seen_names)
+                self._merge_quality_issues(quality_totals, quality_issues)
+
+                # Insert data, leaving the commit until every chunk is loaded
+                if len(cleaned_df) > self.copy_threshold:
+                    records_inserted, insert_errors = self.copy_data_bulk(
+                        cleaned_df, commit=False
+                    )
+                else:
+                    records_inserted, insert_errors = self.insert_data_batch(
+                        cleaned_df, batch_size, commit=False
+                    )
+                result["records_processed"] += len(cleaned_df)
+                result["records_inserted"] += records_inserted
+                if insert_errors:
+                    # The failed insert rolled back every chunk loaded so far
+                    result["errors"].extend(
+                        f"Chunk {chunk_number}: {error}" for error in insert_errors
+                    )
+                    break
+
+            # Missing-value severity is judged against the whole file
+            for issue in quality_totals.values():
+                if issue["type"] == "missing_values":
+                    issue["severity"] = (
+                        "WARNING"
+                        if issue["count"] < result["records_processed"] * 0.1
+                        else "ERROR"
+                    )
+            result["quality_issues"] = list(quality_totals.values())
+            is_quality_ok = all(
+                issue["severity"] != "ERROR" for issue in result["quality_issues"]
             )
-            result["records_processed"] = len(cleaned_df)
-            result["records_inserted"] = records_inserted
-            result["errors"].extend(insert_errors)
+
+            if result["errors"]:
+                self.db.connection.rollback()
+                result["records_inserted"] = 0
+            else:
+                self.db.connection.commit()
+
+            records_inserted = result["records_inserted"]
 
             # Determine success
-            result["success"] = len(insert_errors) == 0 and is_quality_ok
+            result["success"] = len(result["errors"]) == 0 and is_quality_ok
 
             # Log result
             status = (
@@ -425,7 +815,8 @@ class PuzzlePiecesIngestion:
             )
 
             logger.info(
-                f"Ingestion completed: {records_inserted}/{len(cleaned_df)} records inserted"
+                f"Ingestion completed: {records_inserted}/"
+                f"{result['records_processed']} records inserted"
             )
 
         except Exception as e:
@@ -433,6 +824,8 @@ class PuzzlePiecesIngestion:
             logger.error(error_msg)
             result["errors"].append(error_msg)
             result["success"] = False
+            result["records_inserted"] = 0
+            self.db.connection.rollback()
 
             # Log failure
             self.log_processing_result(
@@ -479,6 +872,26 @@ def ingest_puzzle_pieces_csv(
         return ingestion.ingest_csv_file(file_path)
 
 
+async def ingest_puzzle_pieces_csv_async(
+    file_path: str, db_config: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Ingest puzzle pieces from CSV without blocking the event loop.
+
+    The synchronous pipeline (pandas processing and psycopg2 I/O) runs in a
+    worker thread, so asyncio services such as the A2A server keep serving
+    requests during ingestion.
+
+    Args:
+        file_path: Path to the CSV file
+        db_config: Database configuration (optional)
+
+    Returns:
+        Dictionary with ingestion results
+    """
+    return await asyncio.to_thread(ingest_puzzle_pieces_csv, file_path, db_config)
+
+
 if __name__ == "__main__":
     # Test ingestion
     logging.basicConfig(level=logging.INFO)
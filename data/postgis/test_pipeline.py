@@ -272,6 +272,312 @@ def test_data_processing():
         raise
 
 
+def test_points_to_ewkb_hex():
+    """
+    Test client-side EWKB point encoding without database.
+    """
+    logger.info("Testing EWKB point encoding...")
+
+    from .ingestion import points_to_ewkb_hex
+
+    # SELECT ST_AsEWKB(ST_SetSRID(ST_MakePoint(1, 2), 4326)) in PostGIS
+    assert points_to_ewkb_hex([1.0], [2.0]) == [
+        "0101000020E6100000000000000000F03F0000000000000040"
+    ]
+    assert points_to_ewkb_hex([], []) == []
+
+    logger.info("EWKB point encoding test successful!")
+
+
+def test_coordinate_stats():
+    """
+    Test that the Numba and NumPy coordinate checks agree, including on NaN.
+    """
+    logger.info("Testing coordinate statistics...")
+
+    import numpy as np
+    from .ingestion import _coordinate_stats_jit, _coordinate_stats_numpy
+
+    latitudes = np.array([0.0, np.nan, 95.0, -91.0, 0.0, 45.0, np.nan, 0.0])
+    longitudes = np.array([0.0, 0.0, 10.0, 181.0, np.nan, -200.0, np.nan, 0.0])
+    expected = (2, 2, 2)
+
+    assert tuple(_coordinate_stats_numpy(latitudes, longitudes)) == expected
+    if _coordinate_stats_jit is not None:
+        assert tuple(_coordinate_stats_jit(latitudes, longitudes)) == expected
+    else:
+        logger.info("numba not installed; skipped the compiled path")
+
+    logger.info("Coordinate statistics test successful!")
+
+
+def test_coordinate_stats_threads():
+    """
+    Test coordinate statistics called concurrently from several threads, as
+    async ingestion does.
+    """
+    logger.info("Testing coordinate statistics from threads...")
+
+    import numpy as np
+    from concurrent.futures import ThreadPoolExecutor
+    from .ingestion import coordinate_stats
+
+    latitudes = np.tile([0.0, np.nan, 95.0, 45.0], 50_000)
+    longitudes = np.tile([0.0, 0.0, 10.0, -200.0], 50_000)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(
+            executor.map(lambda _: coordinate_stats(latitudes, longitudes), range(16))
+        )
+
+    assert results == [(50_000, 50_000, 50_000)] * 16
+
+    logger.info("Threaded coordinate statistics test successful!")
+
+
+INGESTION_COLUMNS = [
+    "row_number",
+    "name",
+    "entity",
+    "sub_entity",
+    "description",
+    "source_url",
+    "latitude",
+    "longitude",
+]
+
+
+def write_ingestion_csv(rows) -> str:
+    """
+    Write rows under the ingestion header to a temporary CSV file.
+
+    Args:
+        rows: Data rows in INGESTION_COLUMNS order
+
+    Returns:
+        Path to the CSV file
+    """
+    with tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False, newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(INGESTION_COLUMNS)
+        writer.writerows(rows)
+    return f.name
+
+
+def ingestion_row(row_number: int, name: str, latitude=10.0, longitude=20.0):
+    """Build one CSV row with the given name and coordinates."""
+    return [
+        row_number,
+        name,
+        "city",
+        "metropolis",
+        "Test location",
+        "https://example.com",
+        latitude,
+        longitude,
+    ]
+
+
+def run_ingestion(rows, **kwargs):
+    """
+    Ingest rows through a mocked database connection.
+
+    Returns:
+        Tuple of (result, mocked_db)
+    """
+    from unittest.mock import MagicMock, patch
+    from .ingestion import PuzzlePiecesIngestion
+
+    file_path = write_ingestion_csv(rows)
+    db = MagicMock()
+    try:
+        with patch(f"{__package__}.ingestion.execute_values"):
+            result = PuzzlePiecesIngestion(db).ingest_csv_file(file_path, **kwargs)
+    finally:
+        os.unlink(file_path)
+    return result, db
+
+
+def test_ingestion_rejects_invalid_values_in_later_chunk():
+    """
+    Test that out-of-range coordinates in any chunk reject the whole file.
+    """
+    logger.info("Testing invalid values in a later chunk...")
+
+    rows = [ingestion_row(i, f"Location {i}") for i in range(1, 7)]
+    rows[4] = ingestion_row(5, "Location 5", latitude=95.0)
+
+    for chunk_size in (2, 4, 10):
+        result, db = run_ingestion(rows, chunk_size=chunk_size)
+
+        assert not result["success"]
+        assert result["records_inserted"] == 0
+        assert len(result["errors"]) == 1
+        assert result["errors"][0].endswith("Found 1 invalid latitude values")
+        db.connection.commit.assert_not_called()
+
+    logger.info("Invalid values test successful!")
+
+
+def test_ingestion_header_only_file():
+    """
+    Test that a file with only a header is reported as empty.
+    """
+    logger.info("Testing header-only CSV...")
+
+    result, db = run_ingestion([])
+
+    assert not result["success"]
+    assert result["errors"] == ["CSV file is empty"]
+    db.connection.commit.assert_not_called()
+
+    logger.info("Header-only CSV test successful!")
+
+
+def test_ingestion_quality_across_chunks():
+    """
+    Test that quality issues are summed over the whole file, not per chunk.
+    """
+    logger.info("Testing quality issues across chunks...")
+
+    rows = [ingestion_row(i, f"Location {i % 10}") for i in range(20)]
+    rows[0] = ingestion_row(0, "Location 0", longitude="")
+
+    for chunk_size in (4, 20):
+        result, _ = run_ingestion(rows, chunk_size=chunk_size)
+        issues = {issue["type"]: issue for issue in result["quality_issues"]}
+
+        # One missing value in 20 rows stays below the 10% error threshold,
+        # although it is 25% of the first chunk
+        assert issues["missing_values"]["column"] == "longitude"
+        assert issues["missing_values"]["count"] == 1
+        assert issues["missing_values"]["severity"] == "WARNING"
+        # Each name appears once in the first ten rows and again in the last
+        assert issues["duplicate_names"]["count"] == 10
+        assert len(result["quality_issues"]) == 2
+        assert result["success"]
+        assert result["records_processed"] == 20
+
+    logger.info("Quality issues test successful!")
+
+
+def test_insert_data_batch_transaction():
+    """
+    Test that batched inserts commit once, or not at all with commit=False,
+    and roll back on failure.
+    """
+    logger.info("Testing insert transaction handling...")
+
+    import pandas as pd
+    from unittest.mock import MagicMock, patch
+    from .ingestion import PuzzlePiecesIngestion
+
+    df = pd.DataFrame(
+        [ingestion_row(i, f"Location {i}") for i in range(1, 6)],
+        columns=INGESTION_COLUMNS,
+    )
+
+    db = MagicMock()
+    with patch(f"{__package__}.ingestion.execute_values") as mock_execute:
+        inserted, errors = PuzzlePiecesIngestion(db).insert_data_batch(df, 2)
+    assert (inserted, errors) == (5, [])
+    assert mock_execute.call_count == 3
+    db.connection.commit.assert_called_once()
+    db.connection.rollback.assert_not_called()
+
+    db = MagicMock()
+    with patch(f"{__package__}.ingestion.execute_values"):
+        inserted, _ = PuzzlePiecesIngestion(db).insert_data_batch(df, 2, commit=False)
+    assert inserted == 5
+    db.connection.commit.assert_not_called()
+
+    db = MagicMock()
+    with patch(
+        f"{__package__}.ingestion.execute_values",
+        side_effect=[None, Exception("boom")],
+    ):
+        inserted, errors = PuzzlePiecesIngestion(db).insert_data_batch(df, 2)
+    assert inserted == 0
+    assert len(errors) == 1
+    db.connection.commit.assert_not_called()
+    db.connection.rollback.assert_called_once()
+
+    db = MagicMock()
+    inserted, _ = PuzzlePiecesIngestion(db).copy_data_bulk(df, commit=False)
+    assert inserted == 5
+    db.connection.commit.assert_not_called()
+
+    logger.info("Insert transaction test successful!")
+
+
+def test_rows_for_insert_deduplicates_row_numbers():
+    """
+    Test that repeated row_numbers keep only the last row, so one upsert
+    statement never touches the same row twice.
+    """
+    logger.info("Testing row_number deduplication before insert...")
+
+    import pandas as pd
+    from unittest.mock import MagicMock
+    from .ingestion import PuzzlePiecesIngestion
+
+    df = pd.DataFrame(
+        [
+            ingestion_row(1, "First"),
+            ingestion_row(2, "Second"),
+            ingestion_row(1, "First again"),
+        ],
+        columns=INGESTION_COLUMNS,
+    )
+
+    rows = PuzzlePiecesIngestion(MagicMock())._rows_for_insert(df)
+
+    assert rows["row_number"].tolist() == [2, 1]
+    assert rows["name"].tolist() == ["Second", "First again"]
+
+    logger.info("Row number deduplication test successful!")
+
+
+def test_ingestion_rolls_back_on_failed_chunk():
+    """
+    Test that a failed insert in a later chunk rolls back earlier chunks.
+    """
+    logger.info("Testing rollback across chunks...")
+
+    from unittest.mock import MagicMock, patch
+    from .ingestion import PuzzlePiecesIngestion
+
+    rows = [ingestion_row(i, f"Location {i}") for i in range(1, 7)]
+
+    file_path = write_ingestion_csv(rows)
+    db = MagicMock()
+    try:
+        with patch(
+            f"{__package__}.ingestion.execute_values",
+            side_effect=[None, Exception("boom")],
+        ) as mock_execute:
+            result = PuzzlePiecesIngestion(db).ingest_csv_file(file_path, chunk_size=2)
+    finally:
+        os.unlink(file_path)
+
+    # The third chunk is never inserted
+    assert mock_execute.call_count == 2
+    assert not result["success"]
+    assert result["records_inserted"] == 0
+    assert result["errors"][0].startswith("Chunk 2: ")
+    db.connection.commit.assert_not_called()
+    assert db.connection.rollback.called
+
+    # Successful runs commit once after the last chunk
+    result, db = run_ingestion(rows, chunk_size=2)
+    assert result["success"]
+    assert result["records_inserted"] == 6
+    db.connection.commit.assert_called_once()
+    db.connection.rollback.assert_not_called()
+
+    logger.info("Rollback across chunks test successful!")
+
+
 if __name__ == "__main__":
     print("AI Puzzle Pieces Data Pipeline Test")
     print("=" * 40)
@@ -281,6 +587,23 @@ if __name__ == "__main__":
         test_data_processing()
         print()
 
+        test_points_to_ewkb_hex()
+        print()
+
+        test_coordinate_stats()
+        print()
+
+        test_coordinate_stats_threads()
+        print()
+
+        test_ingestion_rejects_invalid_values_in_later_chunk()
+        test_ingestion_header_only_file()
+        test_ingestion_quality_across_chunks()
+        test_insert_data_batch_transaction()
+        test_rows_for_insert_deduplicates_row_numbers()
+        test_ingestion_rolls_back_on_failed_chunk()
+        print()
+
         # Test full pipeline (may fail if PostgreSQL not available)
         test_pipeline()
 
@@ -3,6 +3,7 @@ Error tracking and monitoring for Terra Constellata.
 Integrates Sentry for comprehensive error reporting and monitoring.
 """
 
+import logging
 import os
 import sentry_sdk
 from sentry_sdk.integrations.fastapi import FastApiIntegration
@@ -17,6 +18,11 @@ def init_sentry():
     environment = os.getenv("ENVIRONMENT", "development")
 
     if sentry_dsn:
+        default_traces_rate = "0.01" if environment == "production" else "0.1"
+        http_traces_sample_rate = float(
+            os.getenv("SENTRY_TRACES_SAMPLE_RATE", default_traces_rate)
+        )
+
         sentry_sdk.init(
             dsn=sentry_dsn,
             environment=environment,
@@ -24,18 +30,19 @@ def init_sentry():
                 FastApiIntegration(),
                 SqlAlchemyIntegration(),
                 LoggingIntegration(
-                    level=None,  # Capture all log levels
-                    event_level=None,  # Send all events to Sentry
+                    level=logging.INFO,  # Keep INFO+ records as breadcrumbs
+                    event_level=logging.ERROR,  # Only send ERROR+ as events
                 ),
             ],
             # Performance monitoring
-            traces_sample_rate=1.0 if environment == "production" else 0.1,
+            traces_sampler=make_traces_sampler(http_traces_sample_rate),
+            profiles_sample_rate=float(os.getenv("SENTRY_PROFILES_SAMPLE_RATE", "0.1")),
             # Release tracking
             release=os.getenv("RELEASE_VERSION", "1.0.0"),
             # Error filtering
             before_send=before_send,
-            # User feedback
-            send_default_pii=True,
+            # User context is attached explicitly via set_user_context
+            send_default_pii=False,
         )
 
         app_logger.info(
@@ -43,12 +50,31 @@ def init_sentry():
             extra={
                 "environment": environment,
                 "release": os.getenv("RELEASE_VERSION", "1.0.0"),
+                "traces_sample_rate": http_traces_sample_rate,
             },
         )
     else:
         app_logger.warning("SENTRY_DSN not configured, error tracking disabled")
 
 
+def make_traces_sampler(http_sample_rate):
+    """Build a traces sampler that samples HTTP requests at the given rate."""
+
+    def traces_sampler(sampling_context):
+        # Follow the upstream decision for distributed traces
+        parent_sampled = sampling_context.get("parent_sampled")
+        if parent_sampled is not None:
+            return float(parent_sampled)
+
+        # Request transactions are high volume; custom operations are not
+        op = sampling_context.get("transaction_context", {}).get("op")
+        if op == "http.server":
+            return http_sample_rate
+        return 1.0
+
+    return traces_sampler
+
+
 def before_send(event, hint):
     """Filter and modify events before sending to Sentry."""
     # Don't send events in development for certain log levels